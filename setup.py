@@ -4,22 +4,59 @@ Setup script for Intelligent Backup Enterprise System
 """
 
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, CompileError, ExecError, LinkError, PlatformError
 from pathlib import Path
 
-# Read README for long description
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text()
 
-# Read requirements
+# Read README for long description
+def read_long_description():
+    readme = this_directory / "README.md"
+    return readme.read_text() if readme.exists() else ""
+
+# Read requirements, skipping blank lines and comments
 def read_requirements(filename):
     with open(filename, 'r') as f:
-        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+
+install_requires = list(read_requirements("requirements.txt"))
+dev_requires = list(read_requirements("requirements-dev.txt"))
+
+# Compile hot pure-Python modules when Cython is available; the plain
+# modules are used as-is otherwise
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["src/core/_config_walk.py"],
+        compiler_directives={"language_level": "3"},
+    )
+except ImportError:
+    ext_modules = []
+
+class OptionalBuildExt(build_ext):
+    """Build extensions if possible, falling back to the pure-Python modules"""
+
+    def run(self):
+        try:
+            super().run()
+        except (PlatformError, ExecError) as e:
+            self.warn(f"Skipping optional extensions: {e}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, CompileError, ExecError, LinkError, PlatformError) as e:
+            self.warn(f"Skipping optional extension {ext.name}: {e}")
 
 setup(
     name="intelligent-backup-enterprise",
     version="1.0.0",
     description="Enterprise-grade backup system with semantic file organization",
-    long_description=long_description,
+    long_description=read_long_description(),
     long_description_content_type="text/markdown",
     author="Enterprise Development Team",
     author_email="dev-team@company.com",
@@ -28,12 +65,14 @@ setup(
     # Package discovery
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": OptionalBuildExt},
 
     # Dependencies
-    install_requires=read_requirements("requirements.txt"),
+    install_requires=install_requires,
     extras_require={
-        "dev": read_requirements("requirements-dev.txt"),
-        "all": read_requirements("requirements.txt") + read_requirements("requirements-dev.txt"),
+        "dev": dev_requires,
+        "all": install_requires + dev_requires,
     },
 
     # Python version requirement
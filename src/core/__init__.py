@@ -3,15 +3,41 @@ Intelligent Backup Enterprise Core Module
 Production-grade backup system with enterprise features
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "Enterprise Development Team"
 
-from .backup_orchestrator import EnterpriseBackupOrchestrator
-from .config_manager import EnterpriseConfigManager
-from .monitoring import EnterpriseMonitoring
+if TYPE_CHECKING:
+    from .backup_orchestrator import EnterpriseBackupOrchestrator
+    from .config_manager import EnterpriseConfigManager
+    from .monitoring import EnterpriseMonitoring
+
+# Public symbols are imported on first access (PEP 562) so that callers
+# needing only one component don't pay for the whole dependency stack
+_LAZY_IMPORTS = {
+    "EnterpriseBackupOrchestrator": ".backup_orchestrator",
+    "EnterpriseConfigManager": ".config_manager",
+    "EnterpriseMonitoring": ".monitoring",
+}
 
 __all__ = [
     "EnterpriseBackupOrchestrator",
     "EnterpriseConfigManager",
     "EnterpriseMonitoring"
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import public symbols lazily on first attribute access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
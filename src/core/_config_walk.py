@@ -0,0 +1,71 @@
+"""
+Configuration tree traversal
+Resolves ${VAR[:default]} and secret:// references in loaded configs.
+
+Kept free of class state so setup.py can compile it with Cython when
+available; the pure-Python module is used otherwise.
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Callable, Optional, Set, Tuple
+
+SECRET_PREFIX = "secret://"
+REFERENCE_PREFIXES = ("${", SECRET_PREFIX)
+
+@lru_cache(maxsize=1024)
+def _parse_env_reference(reference: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Split a ${VAR[:default]} reference into (VAR, default), or None"""
+    if not reference.endswith("}"):
+        return None
+
+    env_var, sep, default_value = reference[2:-1].partition(":")
+    return env_var, default_value if sep else None
+
+def materialize(obj: Any, load_secret: Callable[[str], str]) -> Any:
+    """Resolve environment variable and secret references in one pass.
+
+    Containers are rewritten in place, and only where a reference was
+    actually resolved; a tree without references is left untouched. The
+    config tree comes straight from the YAML loader, so nothing outside
+    it holds a reference to it. YAML aliases do share one container
+    between locations, so each container is resolved only on its first
+    visit: resolved values are never resolved again, even when they look
+    like references themselves.
+    """
+    return _materialize(obj, load_secret, set())
+
+def _materialize(obj: Any, load_secret: Callable[[str], str], visited: Set[int]) -> Any:
+    """Resolve obj, skipping containers whose id is already in visited"""
+    obj_type = type(obj)
+    if obj_type is dict or obj_type is list:
+        # The tree stays alive for the whole walk, so ids cannot be reused
+        if id(obj) in visited:
+            return obj
+        visited.add(id(obj))
+    if obj_type is dict:
+        for key, value in obj.items():
+            resolved = _materialize(value, load_secret, visited)
+            if resolved is not value:
+                obj[key] = resolved
+        return obj
+    if obj_type is list:
+        for i, item in enumerate(obj):
+            resolved = _materialize(item, load_secret, visited)
+            if resolved is not item:
+                obj[i] = resolved
+        return obj
+    if obj_type is not str or not obj.startswith(REFERENCE_PREFIXES):
+        return obj
+
+    if obj.startswith("${"):
+        parsed = _parse_env_reference(obj)
+        if parsed is not None:
+            obj = os.getenv(*parsed)
+            # Environment values may themselves be secret references
+            if obj is None or not obj.startswith(SECRET_PREFIX):
+                return obj
+
+    if obj.startswith(SECRET_PREFIX):
+        return load_secret(obj[len(SECRET_PREFIX):])
+    return obj
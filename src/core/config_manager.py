@@ -5,17 +5,48 @@ FAANG-grade configuration management with validation, secrets, and environment s
 """
 
 import os
+import sys
 import yaml
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass
-from jsonschema import validate, ValidationError
+from functools import lru_cache
+from jsonschema import Draft7Validator, ValidationError
+from jsonschema.validators import validator_for
 import logging
 
+from ._config_walk import materialize
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@lru_cache(maxsize=32)
+def _load_schema_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a schema file once per (path, mtime) across all managers"""
+    return _json_loads(Path(path).read_bytes())
+
+@lru_cache(maxsize=32)
+def _compiled_validator(path: str, mtime_ns: int):
+    """Build and check a validator once per (path, mtime) across all managers"""
+    schema = _load_schema_cached(path, mtime_ns)
+    validator_cls = validator_for(schema, default=Draft7Validator)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+@dataclass(**_DATACLASS_SLOTS)
 class BackupConfig:
     """Enterprise backup configuration"""
     source_path: str
@@ -32,7 +63,7 @@ class BackupConfig:
         if self.exclude_patterns is None:
             self.exclude_patterns = ["*.tmp", "*.log", "__pycache__", "node_modules", ".git"]
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MonitoringConfig:
     """Monitoring configuration"""
     enabled: bool = True
@@ -42,7 +73,7 @@ class MonitoringConfig:
     log_format: str = "json"
     retention_days: int = 30
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SecurityConfig:
     """Security configuration"""
     encryption_enabled: bool = True
@@ -51,7 +82,7 @@ class SecurityConfig:
     token_expiry_hours: int = 24
     audit_enabled: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PerformanceConfig:
     """Performance configuration"""
     circuit_breaker_threshold: int = 5
@@ -60,6 +91,14 @@ class PerformanceConfig:
     retry_backoff_multiplier: float = 2.0
     retry_initial_delay_ms: int = 1000
 
+@dataclass(**_DATACLASS_SLOTS)
+class TypedConfigs:
+    """All typed configuration sections, built together from one load"""
+    backup: BackupConfig
+    monitoring: MonitoringConfig
+    security: SecurityConfig
+    performance: PerformanceConfig
+
 class EnterpriseConfigManager:
     """Enterprise configuration manager with validation and secrets support"""
 
@@ -71,6 +110,7 @@ class EnterpriseConfigManager:
 
         self._config: Optional[Dict[str, Any]] = None
         self._schema: Optional[Dict[str, Any]] = None
+        self._typed_bundle: Optional[TypedConfigs] = None
 
     def load_config(self) -> Dict[str, Any]:
         """Load and validate configuration"""
@@ -83,70 +123,57 @@ class EnterpriseConfigManager:
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
         with open(config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YamlLoader)
 
         # Load and validate against schema
-        schema = self._load_schema()
-        if schema:
+        validator = self._get_validator()
+        if validator is not None:
             try:
-                validate(instance=config_data, schema=schema)
+                validator.validate(config_data)
                 logger.info(f"Configuration validated successfully for environment: {self.environment}")
             except ValidationError as e:
                 logger.error(f"Configuration validation failed: {e.message}")
                 raise
 
         # Process environment variables and secrets
-        config_data = self._process_environment_variables(config_data)
-        config_data = self._process_secrets(config_data)
+        config_data = self._materialize(config_data)
 
+        self._typed_bundle = self._build_typed_configs(config_data)
         self._config = config_data
         return self._config
 
+    def _schema_key(self) -> Optional[tuple]:
+        """Cache key (absolute path, mtime) for the schema file, if present"""
+        schema_file = self.schema_dir / "backup_config_schema.json"
+        if not schema_file.exists():
+            logger.warning("Configuration schema not found")
+            return None
+
+        return str(schema_file.resolve()), schema_file.stat().st_mtime_ns
+
     def _load_schema(self) -> Optional[Dict[str, Any]]:
         """Load configuration schema"""
         if self._schema is not None:
             return self._schema
 
-        schema_file = self.schema_dir / "backup_config_schema.json"
-        if not schema_file.exists():
-            logger.warning("Configuration schema not found")
+        key = self._schema_key()
+        if key is None:
             return None
 
-        with open(schema_file, 'r') as f:
-            self._schema = json.load(f)
-
+        self._schema = _load_schema_cached(*key)
         return self._schema
 
-    def _process_environment_variables(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Process environment variable references in config"""
-        def replace_env_vars(obj):
-            if isinstance(obj, dict):
-                return {k: replace_env_vars(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [replace_env_vars(item) for item in obj]
-            elif isinstance(obj, str) and obj.startswith("${") and obj.endswith("}"):
-                env_var = obj[2:-1]
-                default_value = None
-                if ":" in env_var:
-                    env_var, default_value = env_var.split(":", 1)
-                return os.getenv(env_var, default_value)
-            return obj
-
-        return replace_env_vars(config)
-
-    def _process_secrets(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Process secret references in config"""
-        def replace_secrets(obj):
-            if isinstance(obj, dict):
-                return {k: replace_secrets(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [replace_secrets(item) for item in obj]
-            elif isinstance(obj, str) and obj.startswith("secret://"):
-                secret_path = obj[9:]  # Remove 'secret://' prefix
-                return self._load_secret(secret_path)
-            return obj
-
-        return replace_secrets(config)
+    def _get_validator(self):
+        """Get the compiled validator for the configuration schema"""
+        key = self._schema_key()
+        if key is None:
+            return None
+
+        return _compiled_validator(*key)
+
+    def _materialize(self, obj: Any) -> Any:
+        """Resolve environment variable and secret references in place"""
+        return materialize(obj, self._load_secret)
 
     def _load_secret(self, secret_path: str) -> str:
         """Load secret from secure storage"""
@@ -161,62 +188,82 @@ class EnterpriseConfigManager:
 
         return secret_value
 
-    def get_backup_config(self) -> BackupConfig:
-        """Get typed backup configuration"""
-        config = self.load_config()
+    def _build_typed_configs(self, config: Dict[str, Any]) -> TypedConfigs:
+        """Build all typed configuration sections from a materialized config"""
         backup_section = config.get("backup", {})
+        source = backup_section.get("source", {})
+        filters = source.get("filters", {})
+        resources = backup_section.get("resources", {})
+
+        monitoring_section = config.get("monitoring", {})
+        endpoints = monitoring_section.get("endpoints", {})
+        logging_section = monitoring_section.get("logging", {})
+
+        security_section = config.get("security", {})
+        encryption = security_section.get("encryption", {})
+        authentication = security_section.get("authentication", {})
 
-        return BackupConfig(
-            source_path=backup_section.get("source", {}).get("path", "/data/backup-source"),
-            destinations=backup_section.get("destinations", []),
-            max_memory_gb=backup_section.get("resources", {}).get("max_memory_gb", 4.0),
-            max_cpu_percent=backup_section.get("resources", {}).get("max_cpu_percent", 75),
-            concurrent_uploads=backup_section.get("resources", {}).get("concurrent_uploads", 5),
-            batch_size=backup_section.get("resources", {}).get("batch_size", 500),
-            chunk_size_mb=backup_section.get("resources", {}).get("chunk_size_mb", 64),
-            exclude_patterns=backup_section.get("source", {}).get("filters", {}).get("exclude_patterns", None),
-            max_file_size_mb=backup_section.get("source", {}).get("filters", {}).get("max_file_size_mb", 1024)
+        performance_section = config.get("performance", {})
+        circuit_breaker = performance_section.get("circuit_breaker", {})
+        retry_policy = performance_section.get("retry_policy", {})
+
+        return TypedConfigs(
+            backup=BackupConfig(
+                source_path=source.get("path", "/data/backup-source"),
+                destinations=backup_section.get("destinations", []),
+                max_memory_gb=resources.get("max_memory_gb", 4.0),
+                max_cpu_percent=resources.get("max_cpu_percent", 75),
+                concurrent_uploads=resources.get("concurrent_uploads", 5),
+                batch_size=resources.get("batch_size", 500),
+                chunk_size_mb=resources.get("chunk_size_mb", 64),
+                exclude_patterns=filters.get("exclude_patterns", None),
+                max_file_size_mb=filters.get("max_file_size_mb", 1024)
+            ),
+            monitoring=MonitoringConfig(
+                enabled=monitoring_section.get("enabled", True),
+                health_port=endpoints.get("health_port", 8080),
+                metrics_port=endpoints.get("metrics_port", 9090),
+                log_level=logging_section.get("level", "INFO"),
+                log_format=logging_section.get("format", "json"),
+                retention_days=logging_section.get("retention_days", 30)
+            ),
+            security=SecurityConfig(
+                encryption_enabled=encryption.get("enabled", True),
+                encryption_algorithm=encryption.get("algorithm", "AES-256-GCM"),
+                authentication_type=authentication.get("type", "oauth2"),
+                token_expiry_hours=authentication.get("token_expiry_hours", 24),
+                audit_enabled=security_section.get("audit", {}).get("enabled", True)
+            ),
+            performance=PerformanceConfig(
+                circuit_breaker_threshold=circuit_breaker.get("failure_threshold", 5),
+                circuit_breaker_timeout=circuit_breaker.get("timeout_seconds", 30),
+                retry_max_attempts=retry_policy.get("max_attempts", 3),
+                retry_backoff_multiplier=retry_policy.get("backoff_multiplier", 2.0),
+                retry_initial_delay_ms=retry_policy.get("initial_delay_ms", 1000)
+            ),
         )
 
+    def get_all_configs(self) -> TypedConfigs:
+        """Get all typed configuration sections"""
+        if self._typed_bundle is None:
+            self.load_config()
+        return self._typed_bundle
+
+    def get_backup_config(self) -> BackupConfig:
+        """Get typed backup configuration"""
+        return self.get_all_configs().backup
+
     def get_monitoring_config(self) -> MonitoringConfig:
         """Get typed monitoring configuration"""
-        config = self.load_config()
-        monitoring_section = config.get("monitoring", {})
-
-        return MonitoringConfig(
-            enabled=monitoring_section.get("enabled", True),
-            health_port=monitoring_section.get("endpoints", {}).get("health_port", 8080),
-            metrics_port=monitoring_section.get("endpoints", {}).get("metrics_port", 9090),
-            log_level=monitoring_section.get("logging", {}).get("level", "INFO"),
-            log_format=monitoring_section.get("logging", {}).get("format", "json"),
-            retention_days=monitoring_section.get("logging", {}).get("retention_days", 30)
-        )
+        return self.get_all_configs().monitoring
 
     def get_security_config(self) -> SecurityConfig:
         """Get typed security configuration"""
-        config = self.load_config()
-        security_section = config.get("security", {})
-
-        return SecurityConfig(
-            encryption_enabled=security_section.get("encryption", {}).get("enabled", True),
-            encryption_algorithm=security_section.get("encryption", {}).get("algorithm", "AES-256-GCM"),
-            authentication_type=security_section.get("authentication", {}).get("type", "oauth2"),
-            token_expiry_hours=security_section.get("authentication", {}).get("token_expiry_hours", 24),
-            audit_enabled=security_section.get("audit", {}).get("enabled", True)
-        )
+        return self.get_all_configs().security
 
     def get_performance_config(self) -> PerformanceConfig:
         """Get typed performance configuration"""
-        config = self.load_config()
-        performance_section = config.get("performance", {})
-
-        return PerformanceConfig(
-            circuit_breaker_threshold=performance_section.get("circuit_breaker", {}).get("failure_threshold", 5),
-            circuit_breaker_timeout=performance_section.get("circuit_breaker", {}).get("timeout_seconds", 30),
-            retry_max_attempts=performance_section.get("retry_policy", {}).get("max_attempts", 3),
-            retry_backoff_multiplier=performance_section.get("retry_policy", {}).get("backoff_multiplier", 2.0),
-            retry_initial_delay_ms=performance_section.get("retry_policy", {}).get("initial_delay_ms", 1000)
-        )
+        return self.get_all_configs().performance
 
     def get_raw_config(self) -> Dict[str, Any]:
         """Get raw configuration dictionary"""
@@ -226,17 +273,18 @@ class EnterpriseConfigManager:
         """Reload configuration from files"""
         self._config = None
         self._schema = None
+        self._typed_bundle = None
         return self.load_config()
 
     def validate_config(self, config_data: Dict[str, Any]) -> bool:
         """Validate configuration against schema"""
-        schema = self._load_schema()
-        if not schema:
+        validator = self._get_validator()
+        if validator is None:
             return True
 
-        try:
-            validate(instance=config_data, schema=schema)
-            return True
-        except ValidationError as e:
-            logger.error(f"Configuration validation failed: {e.message}")
-            return False
\ No newline at end of file
+        # Pass/fail only needs the first error, not a fully ranked one
+        error = next(validator.iter_errors(config_data), None)
+        if error is not None:
+            logger.error(f"Configuration validation failed: {error.message}")
+            return False
+        return True
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""
+Intelligent Backup Enterprise Monitoring Module
+Metrics, structured logging, and health checks
+"""
@@ -4,26 +4,72 @@ Enterprise Monitoring System
 FAANG-grade observability with metrics, logging, and health checks
 """
 
+import os
+import sys
 import time
 import json
 import logging
+import heapq
+import itertools
 import threading
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
-from prometheus_client import Counter, Histogram, Gauge, start_http_server
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Any, Optional, Callable, List, Set, Tuple
+from dataclasses import dataclass
 from contextlib import contextmanager
-import structlog
-import uuid
-
-# Prometheus Metrics
-backup_files_processed = Counter('backup_files_processed_total', 'Total files processed', ['status', 'file_type'])
-backup_duration = Histogram('backup_operation_duration_seconds', 'Backup operation duration')
-backup_errors = Counter('backup_errors_total', 'Total backup errors', ['error_type', 'severity'])
-system_resource_usage = Gauge('system_resource_usage_percent', 'System resource usage', ['resource_type'])
-active_operations = Gauge('backup_active_operations', 'Currently active backup operations')
-
-@dataclass
+from contextvars import ContextVar
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import structlog
+
+# prometheus_client and structlog are imported on first use so that
+# importing this module stays cheap for callers that never emit telemetry
+
+@lru_cache(maxsize=None)
+def _metrics() -> SimpleNamespace:
+    """Create the process-wide Prometheus metrics on first use"""
+    from prometheus_client import Counter, Histogram, Gauge
+
+    return SimpleNamespace(
+        backup_files_processed=Counter('backup_files_processed_total', 'Total files processed', ['status', 'file_type']),
+        backup_duration=Histogram('backup_operation_duration_seconds', 'Backup operation duration'),
+        backup_errors=Counter('backup_errors_total', 'Total backup errors', ['error_type', 'severity']),
+        system_resource_usage=Gauge('system_resource_usage_percent', 'System resource usage', ['resource_type']),
+        active_operations=Gauge('backup_active_operations', 'Currently active backup operations'),
+    )
+
+# Ports this process already serves metrics on
+_STARTED_METRICS_PORTS: Set[int] = set()
+
+def __getattr__(name):
+    """Expose the Prometheus metrics as lazily created module attributes"""
+    if name in ("backup_files_processed", "backup_duration", "backup_errors",
+                "system_resource_usage", "active_operations"):
+        return getattr(_metrics(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Clock bindings for the health and operation-tracking hot paths
+_now = time.time
+_UTC = timezone.utc
+
+def _utcnow_isoformat() -> str:
+    """Current time as an ISO 8601 UTC string"""
+    return datetime.now(_UTC).isoformat()
+
+@lru_cache(maxsize=256)
+def _utc_isoformat(timestamp: float) -> str:
+    """ISO 8601 UTC rendering of a check timestamp"""
+    return datetime.fromtimestamp(timestamp, _UTC).isoformat()
+
+def _short_id() -> str:
+    """64-bit random hex id; unique enough for correlating traces"""
+    return os.urandom(8).hex()
+
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CorrelationContext:
     """Correlation context for distributed tracing"""
     correlation_id: str
@@ -32,45 +78,60 @@ class CorrelationContext:
     session_id: Optional[str] = None
     start_time: float = 0.0
 
+_STRUCTLOG_CONFIGURED = False
+
+def _configure_structlog(log_level: str):
+    """Configure structlog and stdlib logging once per process"""
+    global _STRUCTLOG_CONFIGURED
+    if _STRUCTLOG_CONFIGURED:
+        return
+
+    import structlog
+
+    # Configure structlog for JSON logging
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="ISO"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.processors.JSONRenderer()
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+    # Setup standard logger
+    logging.basicConfig(
+        format="%(message)s",
+        level=getattr(logging, log_level.upper()),
+    )
+
+    _STRUCTLOG_CONFIGURED = True
+
 class EnterpriseLogger:
     """Enterprise-grade structured logger"""
 
     def __init__(self, service_name: str = "backup-service", log_level: str = "INFO"):
         self.service_name = service_name
 
-        # Configure structlog for JSON logging
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.TimeStamper(fmt="ISO"),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer()
-            ],
-            context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
-
-        # Setup standard logger
-        logging.basicConfig(
-            format="%(message)s",
-            level=getattr(logging, log_level.upper()),
-        )
+        import structlog
 
+        _configure_structlog(log_level)
         self.logger = structlog.get_logger()
+        self._service_logger = self.logger.bind(service=self.service_name)
 
-    def get_logger(self, **context) -> structlog.BoundLogger:
+    def get_logger(self, **context) -> "structlog.BoundLogger":
         """Get logger with context"""
-        return self.logger.bind(
-            service=self.service_name,
-            **context
-        )
+        if not context:
+            return self._service_logger
+        return self._service_logger.bind(**context)
 
 class EnterpriseMetrics:
     """Enterprise metrics collection and reporting"""
@@ -79,72 +140,150 @@ class EnterpriseMetrics:
         self.port = port
         self.custom_metrics: Dict[str, Any] = {}
         self.start_time = time.time()
+        self._metrics = metrics = _metrics()
+
+        # Labelled children keyed by label values, so the hot path skips
+        # prometheus_client's per-call label validation and lookup
+        self._file_children: Dict[Tuple[str, ...], Any] = {
+            ("success", "unknown"): metrics.backup_files_processed.labels("success", "unknown")
+        }
+        self._error_children: Dict[Tuple[str, ...], Any] = {}
+        self._resource_children: Dict[Tuple[str, ...], Any] = {}
+        self._observe_duration = metrics.backup_duration.observe
+        self._set_active_operations = metrics.active_operations.set
+
+    @staticmethod
+    def _child(children: Dict[Tuple[str, ...], Any], metric, *label_values: str):
+        """Get the labelled child for label_values, resolving it on first use"""
+        child = children.get(label_values)
+        if child is None:
+            child = children[label_values] = metric.labels(*label_values)
+        return child
 
     def start_metrics_server(self):
-        """Start Prometheus metrics server"""
+        """Start Prometheus metrics server, once per port per process"""
+        if self.port in _STARTED_METRICS_PORTS:
+            return
+
+        from prometheus_client import start_http_server
+
         start_http_server(self.port)
+        _STARTED_METRICS_PORTS.add(self.port)
 
     def record_file_processed(self, status: str = "success", file_type: str = "unknown"):
         """Record file processing metric"""
-        backup_files_processed.labels(status=status, file_type=file_type).inc()
+        self._child(self._file_children, self._metrics.backup_files_processed, status, file_type).inc()
 
     def record_operation_duration(self, duration_seconds: float):
         """Record operation duration"""
-        backup_duration.observe(duration_seconds)
+        self._observe_duration(duration_seconds)
 
     def record_error(self, error_type: str, severity: str = "medium"):
         """Record error occurrence"""
-        backup_errors.labels(error_type=error_type, severity=severity).inc()
+        self._child(self._error_children, self._metrics.backup_errors, error_type, severity).inc()
+
+    def resource_gauge(self, resource_type: str):
+        """Get the resource usage gauge child for resource_type"""
+        return self._child(self._resource_children, self._metrics.system_resource_usage, resource_type)
 
     def update_resource_usage(self, resource_type: str, usage_percent: float):
         """Update resource usage metric"""
-        system_resource_usage.labels(resource_type=resource_type).set(usage_percent)
+        self.resource_gauge(resource_type).set(usage_percent)
 
     def set_active_operations(self, count: int):
         """Set number of active operations"""
-        active_operations.set(count)
+        self._set_active_operations(count)
 
 class EnterpriseHealthChecker:
     """Enterprise health checking system"""
 
+    # Delay between the first runs of checks registered back to back
+    STAGGER_SECONDS = 0.1
+
     def __init__(self):
         self.checks: Dict[str, bool] = {}
         self.last_check_times: Dict[str, float] = {}
 
+        # All checks share one scheduler thread driven by a min-heap of
+        # (next_run, sequence, name, check_func, interval) entries
+        self._lock = threading.Lock()
+        self._cv = threading.Condition(self._lock)
+        self._heap: List[Tuple[float, int, str, Callable[[], bool], int]] = []
+        self._sequence = itertools.count()
+        self._scheduler: Optional[threading.Thread] = None
+
+        # Bumped whenever a check completes; get_health_status rebuilds
+        # its cached per-check section only when this changes
+        self._status_version = 0
+        self._cached_status_version = -1
+        self._cached_checks: Dict[str, Any] = {}
+        self._cached_healthy = True
+
     def register_check(self, name: str, check_func: callable, interval: int = 30):
         """Register a health check"""
-        def run_check():
-            while True:
-                try:
-                    result = check_func()
-                    self.checks[name] = result
-                    self.last_check_times[name] = time.time()
-                except Exception:
-                    self.checks[name] = False
-                    self.last_check_times[name] = time.time()
-                time.sleep(interval)
-
-        thread = threading.Thread(target=run_check, daemon=True)
-        thread.start()
+        with self._cv:
+            first_run = time.monotonic() + len(self._heap) * self.STAGGER_SECONDS
+            heapq.heappush(self._heap, (first_run, next(self._sequence), name, check_func, interval))
+
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(
+                    target=self._run_scheduler, name="health-checker", daemon=True
+                )
+                self._scheduler.start()
+            self._cv.notify()
+
+    def _run_scheduler(self):
+        """Run due health checks in order, forever"""
+        while True:
+            with self._cv:
+                while True:
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cv.wait(timeout=delay)
+                _, _, name, check_func, interval = heapq.heappop(self._heap)
+
+            try:
+                result = check_func()
+            except Exception:
+                result = False
+
+            with self._cv:
+                self.checks[name] = result
+                self.last_check_times[name] = _now()
+                self._status_version += 1
+                heapq.heappush(
+                    self._heap,
+                    (time.monotonic() + interval, next(self._sequence), name, check_func, interval)
+                )
 
     def get_health_status(self) -> Dict[str, Any]:
-        """Get overall health status"""
-        now = time.time()
-        overall_healthy = all(self.checks.values())
+        """Get overall health status
+
+        The per-check section is rebuilt only after a check has run; each
+        call returns its own copy, so callers may mutate the result.
+        """
+        now = _now()
+        with self._lock:
+            if self._cached_status_version != self._status_version:
+                self._cached_checks = {
+                    name: {
+                        "status": "passing" if status else "failing",
+                        "last_check": _utc_isoformat(self.last_check_times[name])
+                        if name in self.last_check_times else None
+                    }
+                    for name, status in self.checks.items()
+                }
+                self._cached_healthy = all(self.checks.values())
+                self._cached_status_version = self._status_version
+            checks = {name: dict(check) for name, check in self._cached_checks.items()}
+            overall_healthy = self._cached_healthy
 
         return {
             "status": "healthy" if overall_healthy else "unhealthy",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utcnow_isoformat(),
             "uptime_seconds": int(now - getattr(self, 'start_time', now)),
-            "checks": {
-                name: {
-                    "status": "passing" if status else "failing",
-                    "last_check": datetime.fromtimestamp(
-                        self.last_check_times.get(name, 0), timezone.utc
-                    ).isoformat() if name in self.last_check_times else None
-                }
-                for name, status in self.checks.items()
-            }
+            "checks": checks
         }
 
 class EnterpriseAuditLogger:
@@ -188,6 +327,9 @@ class EnterpriseAuditLogger:
 class EnterpriseMonitoring:
     """Main enterprise monitoring orchestrator"""
 
+    # psutil module, resolved by the first system resource check
+    _psutil = None
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = EnterpriseLogger(
@@ -198,8 +340,16 @@ class EnterpriseMonitoring:
         self.health_checker = EnterpriseHealthChecker()
         self.audit_logger = EnterpriseAuditLogger(self.logger)
 
-        # Correlation context
-        self.correlation_context = threading.local()
+        # Correlation context of this instance's innermost active operation;
+        # follows asyncio tasks as well as threads
+        self.correlation_context: ContextVar[Optional[CorrelationContext]] = ContextVar(
+            f"correlation_context_{id(self):x}", default=None
+        )
+
+        # Gauges updated by the periodic resource checks
+        self._cpu_gauge = self.metrics.resource_gauge("cpu")
+        self._memory_gauge = self.metrics.resource_gauge("memory")
+        self._disk_gauge = self.metrics.resource_gauge("disk")
 
     def initialize(self):
         """Initialize monitoring systems"""
@@ -213,17 +363,22 @@ class EnterpriseMonitoring:
 
     def _check_system_resources(self) -> bool:
         """Check system resource availability"""
-        try:
-            import psutil
-            cpu_percent = psutil.cpu_percent()
-            memory_percent = psutil.virtual_memory().percent
+        psutil = EnterpriseMonitoring._psutil
+        if psutil is None:
+            try:
+                import psutil
+            except ImportError:
+                return True  # Skip check if psutil not available
+            EnterpriseMonitoring._psutil = psutil
 
-            self.metrics.update_resource_usage("cpu", cpu_percent)
-            self.metrics.update_resource_usage("memory", memory_percent)
+        # interval=None compares against the previous call instead of blocking
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory_percent = psutil.virtual_memory().percent
 
-            return cpu_percent < 90 and memory_percent < 90
-        except ImportError:
-            return True  # Skip check if psutil not available
+        self._cpu_gauge.set(cpu_percent)
+        self._memory_gauge.set(memory_percent)
+
+        return cpu_percent < 90 and memory_percent < 90
 
     def _check_disk_space(self) -> bool:
         """Check disk space availability"""
@@ -232,7 +387,7 @@ class EnterpriseMonitoring:
             total, used, free = shutil.disk_usage("/")
             disk_percent = (used / total) * 100
 
-            self.metrics.update_resource_usage("disk", disk_percent)
+            self._disk_gauge.set(disk_percent)
             return disk_percent < 90
         except:
             return True
@@ -240,16 +395,17 @@ class EnterpriseMonitoring:
     @contextmanager
     def operation_context(self, operation_name: str, **metadata):
         """Context manager for operation tracking"""
-        correlation_id = str(uuid.uuid4())
-        operation_id = f"{operation_name}_{int(time.time())}"
+        start_time = _now()
+        correlation_id = _short_id()
+        operation_id = f"{operation_name}_{int(start_time)}"
 
-        # Set correlation context
+        # Set correlation context, restoring the enclosing one on exit
         context = CorrelationContext(
             correlation_id=correlation_id,
             operation_id=operation_id,
-            start_time=time.time()
+            start_time=start_time
         )
-        self.correlation_context.value = context
+        context_token = self.correlation_context.set(context)
 
         # Get logger with correlation context
         logger = self.logger.get_logger(
@@ -262,21 +418,24 @@ class EnterpriseMonitoring:
 
         try:
             yield logger
-            duration = time.time() - context.start_time
+            duration = _now() - start_time
             self.metrics.record_operation_duration(duration)
             logger.info(f"Completed {operation_name}", duration_seconds=duration)
 
         except Exception as e:
-            duration = time.time() - context.start_time
+            duration = _now() - start_time
             self.metrics.record_error(str(type(e).__name__), "high")
             logger.error(f"Failed {operation_name}",
                         duration_seconds=duration,
                         error=str(e))
             raise
 
+        finally:
+            self.correlation_context.reset(context_token)
+
     def get_current_context(self) -> Optional[CorrelationContext]:
         """Get current correlation context"""
-        return getattr(self.correlation_context, 'value', None)
+        return self.correlation_context.get()
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get comprehensive health status"""
@@ -0,0 +1,94 @@
+"""
+Progressive test results plugin
+Keeps a JSON summary of the run up to date as each test finishes
+
+Load with: pytest -p tests._progressive_plugin --progressive-results=PATH
+"""
+
+import os
+import json
+from typing import Any, Dict, List
+
+# Suite markers applied by tests/conftest.py, in report order; each gets
+# its own tally. The single definition for conftest.py and test_runner.py.
+SUITE_CATEGORIES = ("unit", "integration", "performance")
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--progressive-results",
+        default=None,
+        metavar="PATH",
+        help="Rewrite PATH with the run summary after every test"
+    )
+
+def pytest_configure(config):
+    path = config.getoption("--progressive-results")
+    # Under xdist the controller receives every worker's reports, so only
+    # it writes and the file never has concurrent writers
+    if path and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ProgressiveResults(path), "progressive_results")
+
+class ProgressiveResults:
+    """Summary in the shape of pytest-json-report's summary section"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.summary: Dict[str, int] = {
+            "total": 0, "passed": 0, "failed": 0, "skipped": 0, "error": 0
+        }
+        self.categories: Dict[str, Dict[str, Any]] = {}
+        self.failed_tests: List[str] = []
+        self.complete = False
+        self._write()
+
+    def pytest_runtest_logreport(self, report):
+        # A failed teardown is an error on top of the test's own outcome
+        if report.when == "teardown":
+            if report.failed:
+                self._tally(report, "error", counts_test=False)
+            return
+
+        # One outcome per test: the call phase, or setup when it failed or skipped
+        if report.when == "call" or report.outcome != "passed":
+            self._tally(report, report.outcome, counts_test=True)
+
+    def _tally(self, report, outcome: str, counts_test: bool):
+        """Count one outcome overall and in the test's suite category"""
+        if counts_test:
+            self.summary["total"] += 1
+        self.summary[outcome] += 1
+
+        for category in SUITE_CATEGORIES:
+            if category in report.keywords:
+                tally = self.categories.get(category)
+                if tally is None:
+                    tally = self.categories[category] = {
+                        "total": 0, "passed": 0, "failed": 0, "skipped": 0, "error": 0,
+                        "duration": 0.0
+                    }
+                if counts_test:
+                    tally["total"] += 1
+                tally[outcome] += 1
+                tally["duration"] += report.duration
+                break
+
+        if report.failed and report.nodeid not in self.failed_tests:
+            self.failed_tests.append(report.nodeid)
+        self._write()
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.complete = True
+        self._write()
+
+    def _write(self):
+        """Replace the file atomically so readers never see a partial write"""
+        data: Dict[str, Any] = {
+            "summary": self.summary,
+            "categories": self.categories,
+            "failed_tests": self.failed_tests,
+            "complete": self.complete
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
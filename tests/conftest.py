@@ -0,0 +1,28 @@
+"""
+Shared pytest configuration
+Marks every test with the suite it belongs to, based on its directory.
+The packages under src/ are imported from the installed project
+(pip install -e .), not via sys.path.
+"""
+
+from pathlib import Path
+
+try:
+    from tests._progressive_plugin import SUITE_CATEGORIES
+except ImportError:  # repository root not on sys.path; tests/ is
+    from _progressive_plugin import SUITE_CATEGORIES
+
+_TESTS_DIR = Path(__file__).parent
+
+def pytest_configure(config):
+    for category in SUITE_CATEGORIES:
+        config.addinivalue_line("markers", f"{category}: tests under tests/{category}/")
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        try:
+            category = item.path.relative_to(_TESTS_DIR).parts[0]
+        except ValueError:
+            continue
+        if category in SUITE_CATEGORIES:
+            item.add_marker(category)
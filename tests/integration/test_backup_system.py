@@ -8,25 +8,102 @@ import pytest
 import tempfile
 import asyncio
 import json
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 import shutil
 import time
-
-# Import system components
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
+import uuid
+import yaml
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+
+# Independent tests share one event loop and run concurrently when
+# pytest-asyncio-concurrent is installed, sequentially otherwise
+try:
+    import pytest_asyncio_concurrent  # noqa: F401
+    async_group = pytest.mark.asyncio_concurrent(group="backup_integration")
+except ImportError:
+    async_group = pytest.mark.asyncio
+
+# Import system components; the project is installed with pip install -e .
 from core.config_manager import EnterpriseConfigManager
 from monitoring.enterprise_monitoring import EnterpriseMonitoring
 
-@pytest.mark.asyncio
+# Per-file processing delay simulated by ConcurrentProcessor; 0 measures
+# scheduling overhead only, set e.g. 0.1 locally to model slow uploads
+SIMULATED_PROCESSING_DELAY = float(os.environ.get("BACKUP_TEST_PROCESSING_DELAY", "0"))
+
+# Suffix tuples for str.endswith filtering of scanned file names
+PY_EXT = (".py",)
+
+# Mock semantic classifications by file extension
+_CLASSIFICATIONS = {
+    ".py": {
+        "file_type": "source_code",
+        "concepts": ("programming", "python"),
+        "importance": 0.8,
+        "cluster": "development"
+    },
+    ".txt": {
+        "file_type": "document",
+        "concepts": ("text", "document"),
+        "importance": 0.6,
+        "cluster": "documents"
+    },
+    ".json": {
+        "file_type": "data",
+        "concepts": ("json", "data"),
+        "importance": 0.7,
+        "cluster": "data"
+    }
+}
+
+_UNKNOWN_CLASSIFICATION = {
+    "file_type": "unknown",
+    "concepts": (),
+    "importance": 0.3,
+    "cluster": "miscellaneous"
+}
+
+def _write_file(path, data: bytes):
+    """Create path containing data with a single open/write/close"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def _scan_files(root):
+    """Yield DirEntry objects for all files under root, recursively"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+def _iter_classified(root, analyzer):
+    """Yield a classification record for each file under root"""
+    for entry in _scan_files(root):
+        yield {
+            "path": entry.path,
+            "name": entry.name,
+            "size": entry.stat().st_size,
+            "classification": analyzer.analyze_file(entry.path)
+        }
+
+@async_group
 class TestBackupSystemIntegration:
     """Integration tests for complete backup system"""
 
-    @pytest.fixture
-    async def temp_environment(self):
-        """Create temporary test environment"""
+    @pytest.fixture(scope="class")
+    def temp_environment(self):
+        """Create temporary test environment, shared by all tests in the class"""
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
@@ -51,18 +128,15 @@ class TestBackupSystemIntegration:
             }
 
             for filename, content in test_files.items():
-                file_path = source_dir / filename
-                if isinstance(content, str):
-                    file_path.write_text(content)
-                else:
-                    file_path.write_bytes(content)
+                data = content.encode() if isinstance(content, str) else content
+                _write_file(source_dir / filename, data)
 
             # Create subdirectories with files
             (source_dir / "subdir1").mkdir()
-            (source_dir / "subdir1" / "nested.txt").write_text("Nested file content")
+            _write_file(source_dir / "subdir1" / "nested.txt", b"Nested file content")
 
             (source_dir / "subdir2").mkdir()
-            (source_dir / "subdir2" / "another.py").write_text("# Another Python file")
+            _write_file(source_dir / "subdir2" / "another.py", b"# Another Python file")
 
             yield {
                 "base_dir": temp_path,
@@ -72,9 +146,25 @@ class TestBackupSystemIntegration:
                 "test_files": test_files
             }
 
+    @pytest.fixture
+    def fresh_dest(self, temp_environment):
+        """Create an empty destination directory for a single test"""
+        dest = temp_environment["base_dir"] / f"dest_{uuid.uuid4().hex}"
+        dest.mkdir()
+        yield dest
+        shutil.rmtree(dest)
+
+    @pytest.fixture
+    def scratch_dir(self, temp_environment):
+        """Create a private working directory so tests never touch the shared source"""
+        scratch = temp_environment["base_dir"] / f"scratch_{uuid.uuid4().hex}"
+        scratch.mkdir()
+        yield scratch
+        shutil.rmtree(scratch)
+
     @pytest.fixture
     def integration_config(self, temp_environment):
-        """Create integration test configuration"""
+        """Integration test configuration data"""
         config_data = {
             "version": "1.0.0",
             "backup": {
@@ -126,21 +216,24 @@ class TestBackupSystemIntegration:
                 },
                 "retry_policy": {
                     "max_attempts": 2,
-                    "backoff_multiplier": 1.0,
-                    "initial_delay_ms": 100
+                    "backoff_multiplier": 2.0,
+                    "initial_delay_ms": 1
                 }
             }
         }
 
-        # Write config file
+        return config_data
+
+    @pytest.fixture
+    def integration_config_file(self, temp_environment, integration_config):
+        """Write the integration configuration for tests that load it from disk"""
         config_file = temp_environment["config_dir"] / "environments" / "integration.yml"
-        import yaml
         with open(config_file, 'w') as f:
-            yaml.dump(config_data, f)
+            yaml.dump(integration_config, f, Dumper=YamlDumper)
 
-        return config_data
+        return config_file
 
-    async def test_config_loading_integration(self, temp_environment, integration_config):
+    async def test_config_loading_integration(self, temp_environment, integration_config_file):
         """Test configuration loading with real files"""
         manager = EnterpriseConfigManager(
             config_dir=str(temp_environment["config_dir"]),
@@ -180,6 +273,10 @@ class TestBackupSystemIntegration:
             with monitoring.operation_context("test_operation", test_id="123") as logger:
                 logger.info("Test operation started")
 
+                # Each instance tracks only its own operations
+                assert monitoring.get_current_context() is not None
+                assert EnterpriseMonitoring(monitoring_config).get_current_context() is None
+
                 # Simulate some work
                 await asyncio.sleep(0.1)
 
@@ -188,12 +285,19 @@ class TestBackupSystemIntegration:
                 monitoring.metrics.record_file_processed("success", "code")
                 monitoring.metrics.record_error("TestError", "low")
 
+        # Correlation context is cleared once the operation ends
+        assert monitoring.get_current_context() is None
+
         # Test health status
         health_status = monitoring.get_health_status()
         assert "status" in health_status
         assert "timestamp" in health_status
         assert "uptime_seconds" in health_status
 
+        # Each status is a copy; mutating one must not leak into the next
+        health_status["checks"]["injected"] = {"status": "passing"}
+        assert "injected" not in monitoring.get_health_status()["checks"]
+
     async def test_file_discovery_and_classification(self, temp_environment):
         """Test file discovery and classification workflow"""
         source_dir = temp_environment["source_dir"]
@@ -201,63 +305,32 @@ class TestBackupSystemIntegration:
         # Mock semantic analyzer
         class MockSemanticAnalyzer:
             def analyze_file(self, file_path: str):
-                file_ext = Path(file_path).suffix.lower()
-                if file_ext == ".py":
-                    return {
-                        "file_type": "source_code",
-                        "concepts": ["programming", "python"],
-                        "importance": 0.8,
-                        "cluster": "development"
-                    }
-                elif file_ext == ".txt":
-                    return {
-                        "file_type": "document",
-                        "concepts": ["text", "document"],
-                        "importance": 0.6,
-                        "cluster": "documents"
-                    }
-                elif file_ext == ".json":
-                    return {
-                        "file_type": "data",
-                        "concepts": ["json", "data"],
-                        "importance": 0.7,
-                        "cluster": "data"
-                    }
-                else:
-                    return {
-                        "file_type": "unknown",
-                        "concepts": [],
-                        "importance": 0.3,
-                        "cluster": "miscellaneous"
-                    }
+                file_ext = os.path.splitext(file_path)[1].lower()
+                return _CLASSIFICATIONS.get(file_ext, _UNKNOWN_CLASSIFICATION)
 
         analyzer = MockSemanticAnalyzer()
 
-        # Discover and classify files
-        discovered_files = []
-        for file_path in source_dir.rglob("*"):
-            if file_path.is_file():
-                classification = analyzer.analyze_file(str(file_path))
-                discovered_files.append({
-                    "path": file_path,
-                    "size": file_path.stat().st_size,
-                    "classification": classification
-                })
+        # Discover and classify files, keeping only what the checks need
+        discovered_count = 0
+        py_files = []
+        for file_info in _iter_classified(source_dir, analyzer):
+            discovered_count += 1
+            if file_info["name"].endswith(PY_EXT):
+                py_files.append(file_info)
 
         # Verify discoveries
-        assert len(discovered_files) >= 5  # At least 5 test files
+        assert discovered_count >= 5  # At least 5 test files
 
         # Check specific classifications
-        py_files = [f for f in discovered_files if f["path"].suffix == ".py"]
         assert len(py_files) >= 2  # code.py and another.py
         for py_file in py_files:
             assert py_file["classification"]["file_type"] == "source_code"
             assert "python" in py_file["classification"]["concepts"]
 
-    async def test_backup_workflow_simulation(self, temp_environment, integration_config):
+    async def test_backup_workflow_simulation(self, temp_environment, fresh_dest, integration_config):
         """Test simulated complete backup workflow"""
         source_dir = temp_environment["source_dir"]
-        dest_dir = temp_environment["dest_dir"]
+        dest_dir = fresh_dest
 
         # Mock backup orchestrator behavior
         class MockBackupOrchestrator:
@@ -265,40 +338,52 @@ class TestBackupSystemIntegration:
                 self.config = config
                 self.files_processed = []
                 self.errors = []
+                self._semaphore = asyncio.Semaphore(
+                    config["backup"]["resources"]["concurrent_uploads"]
+                )
+                # Blocking copies run here so they don't stall the event loop
+                self._copy_pool = ThreadPoolExecutor(
+                    max_workers=config["backup"]["resources"]["concurrent_uploads"]
+                )
 
             async def discover_files(self):
                 """Discover files in source directory"""
-                files = []
-                for file_path in source_dir.rglob("*"):
-                    if file_path.is_file():
-                        files.append({
-                            "path": file_path,
-                            "size": file_path.stat().st_size,
-                            "relative_path": file_path.relative_to(source_dir)
-                        })
-                return files
+                source_str = os.fspath(source_dir)
+                prefix_len = len(source_str) + 1
+                return [
+                    {
+                        "path": entry.path,
+                        "size": entry.stat().st_size,
+                        "relative_path": entry.path[prefix_len:]
+                    }
+                    for entry in _scan_files(source_str)
+                ]
 
-            async def process_batch(self, files_batch):
-                """Process a batch of files"""
-                results = []
-                for file_info in files_batch:
+            async def _process_file(self, file_info):
+                """Process a single file, bounded by the upload concurrency"""
+                async with self._semaphore:
                     try:
                         # Simulate file processing
                         await asyncio.sleep(0.01)  # Simulate processing time
 
                         # Simulate copying file
-                        dest_path = dest_dir / file_info["relative_path"]
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(file_info["path"], dest_path)
+                        dest_path = Path(dest_dir, file_info["relative_path"])
+                        # Data only: copyfile uses sendfile on Linux, and nothing
+                        # here checks the metadata copy2 would also preserve
+                        await asyncio.get_running_loop().run_in_executor(
+                            self._copy_pool, shutil.copyfile, file_info["path"], dest_path
+                        )
 
                         self.files_processed.append(file_info)
-                        results.append({"status": "success", "file": file_info})
+                        return {"status": "success", "file": file_info}
 
                     except Exception as e:
                         self.errors.append({"file": file_info, "error": str(e)})
-                        results.append({"status": "error", "file": file_info, "error": str(e)})
+                        return {"status": "error", "file": file_info, "error": str(e)}
 
-                return results
+            async def process_batch(self, files_batch):
+                """Process a batch of files"""
+                return await asyncio.gather(*(self._process_file(f) for f in files_batch))
 
             async def run_backup(self):
                 """Run complete backup process"""
@@ -307,11 +392,18 @@ class TestBackupSystemIntegration:
                 # Discover files
                 all_files = await self.discover_files()
 
-                # Process in batches
+                # Create each destination directory once, not once per file
+                parents = {Path(dest_dir, f["relative_path"]).parent for f in all_files}
+                for parent in parents:
+                    parent.mkdir(parents=True, exist_ok=True)
+
+                # Process batches concurrently; the semaphore bounds in-flight files
                 batch_size = self.config["backup"]["resources"]["batch_size"]
-                for i in range(0, len(all_files), batch_size):
-                    batch = all_files[i:i + batch_size]
-                    await self.process_batch(batch)
+                batches = [all_files[i:i + batch_size] for i in range(0, len(all_files), batch_size)]
+                try:
+                    await asyncio.gather(*(self.process_batch(batch) for batch in batches))
+                finally:
+                    self._copy_pool.shutdown(wait=True)
 
                 duration = time.time() - start_time
 
@@ -361,10 +453,14 @@ class TestBackupSystemIntegration:
         # Test circuit breaker behavior
         component = FailingComponent()
 
-        # Simulate retry logic
-        max_retries = integration_config["performance"]["retry_policy"]["max_attempts"]
+        # Simulate retry logic with exponential backoff
+        retry_policy = integration_config["performance"]["retry_policy"]
+        max_retries = retry_policy["max_attempts"]
+        initial_delay = retry_policy["initial_delay_ms"] / 1000
+        multiplier = retry_policy["backoff_multiplier"]
 
         success = False
+        delays = []
         for attempt in range(max_retries + 1):
             try:
                 result = await component.process_file("test.txt")
@@ -372,12 +468,15 @@ class TestBackupSystemIntegration:
                 break
             except Exception as e:
                 if attempt < max_retries:
-                    await asyncio.sleep(0.1)  # Retry delay
+                    delay = initial_delay * multiplier ** attempt
+                    delays.append(delay)
+                    await asyncio.sleep(delay)  # Retry delay
                 else:
                     last_error = e
 
         # Should eventually succeed after retries
         assert success is True
+        assert delays == [initial_delay, initial_delay * multiplier]
 
     async def test_resource_monitoring_integration(self, integration_config):
         """Test resource monitoring during operations"""
@@ -386,7 +485,7 @@ class TestBackupSystemIntegration:
         class MockResourceMonitor:
             def __init__(self):
                 self.cpu_usage = 45.0
-                self.memory_usage = 60.0
+                self.memory_usage = 10.0  # 0.8GB of the assumed 8GB
                 self.disk_usage = 30.0
 
             def get_resource_usage(self):
@@ -396,10 +495,10 @@ class TestBackupSystemIntegration:
                     "disk_percent": self.disk_usage
                 }
 
-            def simulate_load(self):
-                """Simulate increasing resource usage"""
-                self.cpu_usage = min(90.0, self.cpu_usage + 10)
-                self.memory_usage = min(85.0, self.memory_usage + 5)
+            def simulate_load(self, steps=1):
+                """Simulate increasing resource usage over the given number of steps"""
+                self.cpu_usage = min(90.0, self.cpu_usage + 10 * steps)
+                self.memory_usage = min(85.0, self.memory_usage + 5 * steps)
 
             def check_thresholds(self, config):
                 """Check if usage exceeds thresholds"""
@@ -424,24 +523,40 @@ class TestBackupSystemIntegration:
         assert monitor.check_thresholds(integration_config) is True
 
         # Simulate high load
+        monitor.simulate_load(steps=5)
+
+        # CPU is clamped at its ceiling; memory grows 5 points per step
+        assert monitor.get_resource_usage() == {
+            "cpu_percent": 90.0,
+            "memory_percent": 35.0,
+            "disk_percent": 30.0
+        }
+
+        # Matches applying the load one step at a time
+        stepped = MockResourceMonitor()
         for _ in range(5):
-            monitor.simulate_load()
+            stepped.simulate_load()
+        assert stepped.get_resource_usage() == monitor.get_resource_usage()
 
         # Should now exceed thresholds
         assert monitor.check_thresholds(integration_config) is False
 
-    async def test_concurrent_operations(self, temp_environment, integration_config):
+    async def test_concurrent_operations(self, scratch_dir, integration_config):
         """Test concurrent backup operations"""
-        source_dir = temp_environment["source_dir"]
-
         # Create additional test files for concurrent processing
-        for i in range(10):
-            (source_dir / f"concurrent_test_{i}.txt").write_text(f"Concurrent test file {i}")
+        file_paths = [scratch_dir / f"concurrent_test_{i}.txt" for i in range(10)]
+
+        def make_test_file(i):
+            _write_file(file_paths[i], f"Concurrent test file {i}".encode())
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(make_test_file, range(10)))
 
         # Mock concurrent processor
         class ConcurrentProcessor:
-            def __init__(self, max_concurrent):
+            def __init__(self, max_concurrent, delay=0.0):
                 self.max_concurrent = max_concurrent
+                self.delay = delay
                 self.active_tasks = 0
                 self.completed_tasks = 0
                 self.max_active = 0
@@ -450,8 +565,8 @@ class TestBackupSystemIntegration:
                 self.active_tasks += 1
                 self.max_active = max(self.max_active, self.active_tasks)
 
-                # Simulate processing time
-                await asyncio.sleep(0.1)
+                # Yield to the scheduler, optionally simulating processing time
+                await asyncio.sleep(self.delay)
 
                 self.active_tasks -= 1
                 self.completed_tasks += 1
@@ -459,39 +574,46 @@ class TestBackupSystemIntegration:
                 return {"status": "success", "file": str(file_path)}
 
             async def process_files_concurrently(self, file_paths):
-                # Create semaphore to limit concurrency
-                semaphore = asyncio.Semaphore(self.max_concurrent)
-
-                async def process_with_semaphore(file_path):
-                    async with semaphore:
-                        return await self.process_file(file_path)
-
-                # Process all files concurrently
-                tasks = [process_with_semaphore(fp) for fp in file_paths]
-                results = await asyncio.gather(*tasks)
+                # A fixed pool of workers drains the queue, so at most
+                # max_concurrent files are in flight and only that many
+                # tasks exist regardless of the number of files
+                queue = asyncio.Queue()
+                for item in enumerate(file_paths):
+                    queue.put_nowait(item)
+                results = [None] * len(file_paths)
+
+                async def worker():
+                    while True:
+                        try:
+                            index, file_path = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        results[index] = await self.process_file(file_path)
+
+                await asyncio.gather(*(worker() for _ in range(self.max_concurrent)))
 
                 return results
 
         # Test concurrent processing
         processor = ConcurrentProcessor(
-            max_concurrent=integration_config["backup"]["resources"]["concurrent_uploads"]
+            max_concurrent=integration_config["backup"]["resources"]["concurrent_uploads"],
+            delay=SIMULATED_PROCESSING_DELAY
         )
 
-        file_paths = list(source_dir.glob("concurrent_test_*.txt"))
-        assert len(file_paths) == 10
+        assert all(path.is_file() for path in file_paths)
 
-        start_time = time.time()
         results = await processor.process_files_concurrently(file_paths)
-        duration = time.time() - start_time
 
         # Verify results
         assert len(results) == 10
         assert all(r["status"] == "success" for r in results)
         assert processor.completed_tasks == 10
-        assert processor.max_active <= integration_config["backup"]["resources"]["concurrent_uploads"]
 
-        # Should be faster than sequential processing
-        assert duration < 1.0  # Should complete in less than 1 second with concurrency
+        # Every worker starts a file before any finishes, since each yields
+        # inside process_file; checking the peak instead of wall-clock time
+        # keeps this exact on loaded runners
+        concurrent_uploads = integration_config["backup"]["resources"]["concurrent_uploads"]
+        assert processor.max_active == min(concurrent_uploads, len(file_paths))
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
@@ -4,141 +4,247 @@ Unit tests for Enterprise Configuration Manager
 """
 
 import pytest
-import tempfile
+import copy
 import yaml
 import json
-from pathlib import Path
-from unittest.mock import patch, mock_open
 import os
+from pathlib import Path
+from dataclasses import fields
+from jsonschema.validators import validator_for
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
 
-# Import the module to test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
 
+# Import the module to test; the project is installed with pip install -e .
 from core.config_manager import (
     EnterpriseConfigManager,
     BackupConfig,
     MonitoringConfig,
     SecurityConfig,
-    PerformanceConfig
+    PerformanceConfig,
+    TypedConfigs
 )
 
+# Sample configuration data
+SAMPLE_CONFIG = {
+    "version": "1.0.0",
+    "backup": {
+        "source": {
+            "path": "/test/source",
+            "filters": {
+                "exclude_patterns": ["*.tmp", "*.log"],
+                "max_file_size_mb": 512
+            }
+        },
+        "destinations": [
+            {
+                "type": "icloud",
+                "config": {"path": "/test/destination"}
+            }
+        ],
+        "resources": {
+            "max_memory_gb": 2.0,
+            "max_cpu_percent": 50,
+            "concurrent_uploads": 3,
+            "batch_size": 100,
+            "chunk_size_mb": 32
+        }
+    },
+    "monitoring": {
+        "enabled": True,
+        "endpoints": {
+            "health_port": 8080,
+            "metrics_port": 9090
+        },
+        "logging": {
+            "level": "INFO",
+            "format": "json",
+            "retention_days": 7
+        }
+    },
+    "security": {
+        "encryption": {
+            "enabled": True,
+            "algorithm": "AES-256-GCM"
+        },
+        "authentication": {
+            "type": "oauth2",
+            "token_expiry_hours": 12
+        },
+        "audit": {
+            "enabled": True
+        }
+    },
+    "performance": {
+        "circuit_breaker": {
+            "failure_threshold": 3,
+            "timeout_seconds": 15
+        },
+        "retry_policy": {
+            "max_attempts": 2,
+            "backoff_multiplier": 1.5,
+            "initial_delay_ms": 500
+        }
+    }
+}
+
+# Sample JSON schema
+SAMPLE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["version", "backup"],
+    "properties": {
+        "version": {"type": "string"},
+        "backup": {"type": "object"}
+    }
+}
+
+# Serialized once at import; tests write these bytes instead of re-emitting
+SAMPLE_CONFIG_YAML = yaml.dump(SAMPLE_CONFIG, Dumper=YamlDumper).encode()
+SAMPLE_SCHEMA_JSON = _json_dumps(SAMPLE_SCHEMA)
+
+def _write_files(*files):
+    """Write each (path, data) pair with a single open/write/close"""
+    for path, data in files:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+# Typed sections SAMPLE_CONFIG should load as; dataclass equality checks
+# the type and every field at once
+EXPECTED_BACKUP = BackupConfig(
+    source_path="/test/source",
+    destinations=[{"type": "icloud", "config": {"path": "/test/destination"}}],
+    max_memory_gb=2.0,
+    max_cpu_percent=50,
+    concurrent_uploads=3,
+    batch_size=100,
+    chunk_size_mb=32,
+    exclude_patterns=["*.tmp", "*.log"],
+    max_file_size_mb=512
+)
+EXPECTED_MONITORING = MonitoringConfig(
+    enabled=True,
+    health_port=8080,
+    metrics_port=9090,
+    log_level="INFO",
+    log_format="json",
+    retention_days=7
+)
+EXPECTED_SECURITY = SecurityConfig(
+    encryption_enabled=True,
+    encryption_algorithm="AES-256-GCM",
+    authentication_type="oauth2",
+    token_expiry_hours=12,
+    audit_enabled=True
+)
+EXPECTED_PERFORMANCE = PerformanceConfig(
+    circuit_breaker_threshold=3,
+    circuit_breaker_timeout=15,
+    retry_max_attempts=2,
+    retry_backoff_multiplier=1.5,
+    retry_initial_delay_ms=500
+)
+
+EXPECTED_TYPED_CONFIGS = {
+    "get_backup_config": EXPECTED_BACKUP,
+    "get_monitoring_config": EXPECTED_MONITORING,
+    "get_security_config": EXPECTED_SECURITY,
+    "get_performance_config": EXPECTED_PERFORMANCE
+}
+
+# One case per (getter, field) so a failure names the exact field
+TYPED_CONFIG_FIELDS = [
+    pytest.param(getter, f.name, getattr(expected, f.name), id=f"{getter}-{f.name}")
+    for getter, expected in EXPECTED_TYPED_CONFIGS.items()
+    for f in fields(expected)
+]
+
+# Compiled once for checks that don't need a manager
+SAMPLE_VALIDATOR = validator_for(SAMPLE_SCHEMA)(SAMPLE_SCHEMA)
+
 class TestEnterpriseConfigManager:
     """Test cases for EnterpriseConfigManager"""
 
-    @pytest.fixture
-    def temp_config_dir(self):
-        """Create temporary configuration directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "config"
-            config_dir.mkdir(parents=True)
+    @staticmethod
+    def _make_config_dir(base_dir: Path) -> Path:
+        """Create the configuration directory layout in a fresh base_dir"""
+        # base_dir is already unique, so it serves as the config dir itself
+        (base_dir / "environments").mkdir()
+        (base_dir / "schemas").mkdir()
 
-            # Create subdirectories
-            (config_dir / "environments").mkdir()
-            (config_dir / "schemas").mkdir()
+        return base_dir
 
-            yield config_dir
+    @pytest.fixture(scope="session")
+    def temp_config_dir(self, tmp_path_factory):
+        """Create the shared configuration directory once per worker; tests must not write to it"""
+        return self._make_config_dir(tmp_path_factory.mktemp("cfg"))
+
+    @pytest.fixture(scope="session")
+    def written_config_file(self, temp_config_dir):
+        """Write the sample config as the shared test environment once"""
+        config_file = temp_config_dir / "environments" / "test.yml"
+        _write_files((config_file, SAMPLE_CONFIG_YAML))
+        return config_file
+
+    @pytest.fixture(scope="session")
+    def compiled_validator(self):
+        """Validator for the sample schema"""
+        return SAMPLE_VALIDATOR
+
+    @pytest.fixture(scope="session")
+    def temp_config_dir_str(self, temp_config_dir):
+        """Shared configuration directory as the str the manager takes"""
+        return str(temp_config_dir)
+
+    @pytest.fixture(scope="session")
+    def make_manager(self, temp_config_dir_str):
+        """Factory for managers on the shared config dir, or on config_dir when given"""
+        def _make(environment="test", config_dir=None):
+            return EnterpriseConfigManager(
+                config_dir=temp_config_dir_str if config_dir is None else str(config_dir),
+                environment=environment
+            )
+        return _make
+
+    @pytest.fixture(scope="module")
+    def loaded_manager(self, make_manager, written_config_file):
+        """Manager with the shared config already loaded; tests must not reload it"""
+        manager = make_manager()
+        manager.load_config()
+        return manager
 
     @pytest.fixture
+    def isolated_config_dir(self, tmp_path):
+        """Create a private configuration directory for tests that write files"""
+        return self._make_config_dir(tmp_path)
+
+    @pytest.fixture(scope="session")
     def sample_config(self):
         """Sample configuration data"""
-        return {
-            "version": "1.0.0",
-            "backup": {
-                "source": {
-                    "path": "/test/source",
-                    "filters": {
-                        "exclude_patterns": ["*.tmp", "*.log"],
-                        "max_file_size_mb": 512
-                    }
-                },
-                "destinations": [
-                    {
-                        "type": "icloud",
-                        "config": {"path": "/test/destination"}
-                    }
-                ],
-                "resources": {
-                    "max_memory_gb": 2.0,
-                    "max_cpu_percent": 50,
-                    "concurrent_uploads": 3,
-                    "batch_size": 100,
-                    "chunk_size_mb": 32
-                }
-            },
-            "monitoring": {
-                "enabled": True,
-                "endpoints": {
-                    "health_port": 8080,
-                    "metrics_port": 9090
-                },
-                "logging": {
-                    "level": "INFO",
-                    "format": "json",
-                    "retention_days": 7
-                }
-            },
-            "security": {
-                "encryption": {
-                    "enabled": True,
-                    "algorithm": "AES-256-GCM"
-                },
-                "authentication": {
-                    "type": "oauth2",
-                    "token_expiry_hours": 12
-                },
-                "audit": {
-                    "enabled": True
-                }
-            },
-            "performance": {
-                "circuit_breaker": {
-                    "failure_threshold": 3,
-                    "timeout_seconds": 15
-                },
-                "retry_policy": {
-                    "max_attempts": 2,
-                    "backoff_multiplier": 1.5,
-                    "initial_delay_ms": 500
-                }
-            }
-        }
-
-    @pytest.fixture
-    def sample_schema(self):
-        """Sample JSON schema"""
-        return {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "required": ["version", "backup"],
-            "properties": {
-                "version": {"type": "string"},
-                "backup": {"type": "object"}
-            }
-        }
+        return SAMPLE_CONFIG
 
-    def test_config_manager_initialization(self, temp_config_dir):
+    def test_config_manager_initialization(self, make_manager, temp_config_dir):
         """Test configuration manager initialization"""
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
+        manager = make_manager()
 
         assert manager.config_dir == temp_config_dir
         assert manager.environment == "test"
         assert manager._config is None
 
-    def test_load_config_success(self, temp_config_dir, sample_config):
+    def test_load_config_success(self, make_manager, written_config_file, sample_config):
         """Test successful configuration loading"""
-        # Write test config file
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(sample_config, f)
-
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
+        manager = make_manager()
 
         config = manager.load_config()
 
@@ -146,38 +252,39 @@ class TestEnterpriseConfigManager:
         assert config["version"] == "1.0.0"
         assert config["backup"]["source"]["path"] == "/test/source"
 
-    def test_load_config_file_not_found(self, temp_config_dir):
+    def test_load_config_file_not_found(self, make_manager):
         """Test configuration loading with missing file"""
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="nonexistent"
-        )
+        manager = make_manager("nonexistent")
 
         with pytest.raises(FileNotFoundError):
             manager.load_config()
 
-    def test_config_validation_success(self, temp_config_dir, sample_config, sample_schema):
+    def test_config_validation_success(self, make_manager, isolated_config_dir, sample_config,
+                                       compiled_validator):
         """Test successful configuration validation"""
-        # Write config and schema files
-        config_file = temp_config_dir / "environments" / "test.yml"
-        schema_file = temp_config_dir / "schemas" / "backup_config_schema.json"
+        assert compiled_validator.is_valid(sample_config)
 
-        with open(config_file, 'w') as f:
-            yaml.dump(sample_config, f)
-
-        with open(schema_file, 'w') as f:
-            json.dump(sample_schema, f)
+        # Write config and schema files
+        config_file = isolated_config_dir / "environments" / "test.yml"
+        schema_file = isolated_config_dir / "schemas" / "backup_config_schema.json"
 
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
+        _write_files(
+            (config_file, SAMPLE_CONFIG_YAML),
+            (schema_file, SAMPLE_SCHEMA_JSON)
         )
 
+        manager = make_manager(config_dir=isolated_config_dir)
+
         # Should not raise an exception
         config = manager.load_config()
         assert config == sample_config
 
-    def test_environment_variable_processing(self, temp_config_dir):
+    @pytest.mark.parametrize("env_value,expected_path", [
+        ("/env/path", "/env/path"),
+        (None, "/default/path")  # Unset: the default applies
+    ])
+    def test_environment_variable_processing(self, make_manager, isolated_config_dir,
+                                             monkeypatch, env_value, expected_path):
         """Test environment variable substitution"""
         config_with_env = {
             "backup": {
@@ -187,29 +294,20 @@ class TestEnterpriseConfigManager:
             }
         }
 
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_with_env, f)
+        config_file = isolated_config_dir / "environments" / "test.yml"
+        _write_files((config_file, yaml.dump(config_with_env, Dumper=YamlDumper).encode()))
 
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
+        manager = make_manager(config_dir=isolated_config_dir)
 
-        # Test with environment variable set
-        with patch.dict(os.environ, {"BACKUP_SOURCE_PATH": "/env/path"}):
-            config = manager.load_config()
-            assert config["backup"]["source"]["path"] == "/env/path"
+        if env_value is None:
+            monkeypatch.delenv("BACKUP_SOURCE_PATH", raising=False)
+        else:
+            monkeypatch.setenv("BACKUP_SOURCE_PATH", env_value)
 
-        # Reset for next test
-        manager._config = None
-
-        # Test with environment variable not set (should use default)
-        with patch.dict(os.environ, {}, clear=True):
-            config = manager.load_config()
-            assert config["backup"]["source"]["path"] == "/default/path"
+        config = manager.load_config()
+        assert config["backup"]["source"]["path"] == expected_path
 
-    def test_secret_processing(self, temp_config_dir):
+    def test_secret_processing(self, make_manager, isolated_config_dir, monkeypatch):
         """Test secret reference processing"""
         config_with_secrets = {
             "database": {
@@ -217,133 +315,146 @@ class TestEnterpriseConfigManager:
             }
         }
 
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_with_secrets, f)
+        config_file = isolated_config_dir / "environments" / "test.yml"
+        _write_files((config_file, yaml.dump(config_with_secrets, Dumper=YamlDumper).encode()))
 
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
+        manager = make_manager(config_dir=isolated_config_dir)
 
         # Mock secret loading
-        with patch.dict(os.environ, {"SECRET_DATABASE_PASSWORD": "super-secret"}):
-            config = manager.load_config()
-            assert config["database"]["password"] == "super-secret"
-
-    def test_get_backup_config(self, temp_config_dir, sample_config):
-        """Test getting typed backup configuration"""
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(sample_config, f)
-
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
-
-        backup_config = manager.get_backup_config()
-
-        assert isinstance(backup_config, BackupConfig)
-        assert backup_config.source_path == "/test/source"
-        assert backup_config.max_memory_gb == 2.0
-        assert backup_config.concurrent_uploads == 3
-        assert backup_config.exclude_patterns == ["*.tmp", "*.log"]
-
-    def test_get_monitoring_config(self, temp_config_dir, sample_config):
-        """Test getting typed monitoring configuration"""
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(sample_config, f)
-
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
-
-        monitoring_config = manager.get_monitoring_config()
-
-        assert isinstance(monitoring_config, MonitoringConfig)
-        assert monitoring_config.enabled is True
-        assert monitoring_config.health_port == 8080
-        assert monitoring_config.metrics_port == 9090
-        assert monitoring_config.log_level == "INFO"
-        assert monitoring_config.log_format == "json"
-
-    def test_get_security_config(self, temp_config_dir, sample_config):
-        """Test getting typed security configuration"""
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(sample_config, f)
-
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
-
-        security_config = manager.get_security_config()
-
-        assert isinstance(security_config, SecurityConfig)
-        assert security_config.encryption_enabled is True
-        assert security_config.encryption_algorithm == "AES-256-GCM"
-        assert security_config.authentication_type == "oauth2"
-        assert security_config.token_expiry_hours == 12
-        assert security_config.audit_enabled is True
-
-    def test_get_performance_config(self, temp_config_dir, sample_config):
-        """Test getting typed performance configuration"""
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(sample_config, f)
+        monkeypatch.setenv("SECRET_DATABASE_PASSWORD", "super-secret")
+        config = manager.load_config()
+        assert config["database"]["password"] == "super-secret"
+
+    def test_references_in_lists(self, make_manager, isolated_config_dir, monkeypatch):
+        """Test env and secret references are resolved inside lists"""
+        config_with_refs = {
+            "destinations": [
+                {"token": "secret://gdrive/token"},
+                "${DEST_PATH:/default/dest}",
+                42
+            ]
+        }
 
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
+        config_file = isolated_config_dir / "environments" / "test.yml"
+        _write_files((config_file, yaml.dump(config_with_refs, Dumper=YamlDumper).encode()))
 
-        performance_config = manager.get_performance_config()
+        manager = make_manager(config_dir=isolated_config_dir)
 
-        assert isinstance(performance_config, PerformanceConfig)
-        assert performance_config.circuit_breaker_threshold == 3
-        assert performance_config.circuit_breaker_timeout == 15
-        assert performance_config.retry_max_attempts == 2
-        assert performance_config.retry_backoff_multiplier == 1.5
-        assert performance_config.retry_initial_delay_ms == 500
+        monkeypatch.setenv("SECRET_GDRIVE_TOKEN", "tok")
+        monkeypatch.delenv("DEST_PATH", raising=False)
+        config = manager.load_config()
+        assert config["destinations"] == [{"token": "tok"}, "/default/dest", 42]
+
+    def test_references_in_yaml_aliases(self, make_manager, isolated_config_dir, monkeypatch):
+        """Test references inside an aliased mapping resolve at every alias"""
+        config_file = isolated_config_dir / "environments" / "test.yml"
+        _write_files((config_file, (
+            b"shared: &shared\n"
+            b"  path: ${ALIAS_PATH:/default/alias}\n"
+            b"  token: secret://alias/token\n"
+            b"primary: *shared\n"
+            b"replica: *shared\n"
+        )))
+
+        manager = make_manager(config_dir=isolated_config_dir)
+
+        monkeypatch.setenv("ALIAS_PATH", "/env/alias")
+        monkeypatch.setenv("SECRET_ALIAS_TOKEN", "tok")
+        config = manager.load_config()
+        expected = {"path": "/env/alias", "token": "tok"}
+        assert config["shared"] == expected
+        assert config["primary"] == expected
+        assert config["replica"] == expected
+
+    def test_yaml_aliases_resolved_once(self, make_manager, isolated_config_dir, monkeypatch):
+        """Test resolved values that look like references are not resolved again via aliases"""
+        config_file = isolated_config_dir / "environments" / "test.yml"
+        _write_files((config_file, (
+            b"shared: &shared\n"
+            b"  path: ${ALIAS_PATH}\n"
+            b"  token: secret://alias/token\n"
+            b"  ref: ${ALIAS_REF}\n"
+            b"hosts: &hosts ['${ALIAS_PATH}']\n"
+            b"primary: *shared\n"
+            b"replica: *shared\n"
+            b"mirror: *hosts\n"
+        )))
+
+        manager = make_manager(config_dir=isolated_config_dir)
+        secret_paths = []
+        load_secret = manager._load_secret
+
+        def counting_load_secret(secret_path):
+            secret_paths.append(secret_path)
+            return load_secret(secret_path)
+
+        monkeypatch.setattr(manager, "_load_secret", counting_load_secret)
+        monkeypatch.setenv("ALIAS_PATH", "${HOME}")
+        monkeypatch.setenv("ALIAS_REF", "secret://alias/token")
+        monkeypatch.setenv("SECRET_ALIAS_TOKEN", "secret://alias/other")
+        config = manager.load_config()
 
-    def test_config_reload(self, temp_config_dir, sample_config):
+        expected = {
+            "path": "${HOME}",
+            "token": "secret://alias/other",
+            "ref": "secret://alias/other"
+        }
+        assert config["shared"] == expected
+        assert config["primary"] == expected
+        assert config["replica"] == expected
+        assert config["hosts"] == config["mirror"] == ["${HOME}"]
+        assert secret_paths == ["alias/token", "alias/token"]
+
+    @pytest.mark.parametrize("getter,field,expected", TYPED_CONFIG_FIELDS)
+    def test_get_typed_config(self, loaded_manager, getter, field, expected):
+        """Test each field of each typed configuration section"""
+        actual = getattr(getattr(loaded_manager, getter)(), field)
+        assert actual == expected
+        if isinstance(expected, bool):
+            assert actual is expected
+
+    @pytest.mark.parametrize("getter,expected", list(EXPECTED_TYPED_CONFIGS.items()))
+    def test_typed_config_type(self, loaded_manager, getter, expected):
+        """Test each getter returns its section's dataclass"""
+        assert type(getattr(loaded_manager, getter)()) is type(expected)
+
+    def test_config_reload(self, make_manager, isolated_config_dir, sample_config):
         """Test configuration reloading"""
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(sample_config, f)
+        config_file = isolated_config_dir / "environments" / "test.yml"
+        _write_files((config_file, SAMPLE_CONFIG_YAML))
 
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
+        manager = make_manager(config_dir=isolated_config_dir)
 
         # Load initial config
         config1 = manager.load_config()
         assert config1["backup"]["source"]["path"] == "/test/source"
 
-        # Modify config file
-        sample_config["backup"]["source"]["path"] = "/new/source"
-        with open(config_file, 'w') as f:
-            yaml.dump(sample_config, f)
+        # Modify config file; sample_config is shared, so change a copy
+        new_config = copy.deepcopy(sample_config)
+        new_config["backup"]["source"]["path"] = "/new/source"
+        _write_files((config_file, yaml.dump(new_config, Dumper=YamlDumper).encode()))
 
         # Reload config
         config2 = manager.reload_config()
         assert config2["backup"]["source"]["path"] == "/new/source"
+        assert manager.get_backup_config().source_path == "/new/source"
+
+    def test_typed_configs_built_once(self, make_manager, written_config_file):
+        """Test typed configurations are materialized once per load"""
+        manager = make_manager()
 
-    def test_validate_config_method(self, temp_config_dir, sample_schema):
+        bundle = manager.get_all_configs()
+        assert isinstance(bundle, TypedConfigs)
+        assert manager.get_backup_config() is bundle.backup
+        assert manager.get_performance_config() is bundle.performance
+        assert manager.get_all_configs() is bundle
+
+    def test_validate_config_method(self, make_manager, isolated_config_dir):
         """Test standalone config validation method"""
-        schema_file = temp_config_dir / "schemas" / "backup_config_schema.json"
-        with open(schema_file, 'w') as f:
-            json.dump(sample_schema, f)
+        schema_file = isolated_config_dir / "schemas" / "backup_config_schema.json"
+        _write_files((schema_file, SAMPLE_SCHEMA_JSON))
 
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
+        manager = make_manager(config_dir=isolated_config_dir)
 
         # Valid config
         valid_config = {"version": "1.0.0", "backup": {}}
@@ -353,7 +464,30 @@ class TestEnterpriseConfigManager:
         invalid_config = {"backup": {}}  # Missing required 'version'
         assert manager.validate_config(invalid_config) is False
 
-    def test_default_values(self, temp_config_dir):
+    def test_manager_validator_matches_schema(self, make_manager, isolated_config_dir,
+                                              compiled_validator):
+        """Test the manager compiles the same validator class for the schema"""
+        schema_file = isolated_config_dir / "schemas" / "backup_config_schema.json"
+        _write_files((schema_file, SAMPLE_SCHEMA_JSON))
+
+        manager = make_manager(config_dir=isolated_config_dir)
+
+        validator = manager._get_validator()
+        assert type(validator) is type(compiled_validator)
+        assert validator.schema == compiled_validator.schema
+
+    def test_schema_shared_across_instances(self, make_manager, isolated_config_dir):
+        """Test schema and validator are parsed once and shared across managers"""
+        schema_file = isolated_config_dir / "schemas" / "backup_config_schema.json"
+        _write_files((schema_file, SAMPLE_SCHEMA_JSON))
+
+        manager1 = make_manager(config_dir=isolated_config_dir)
+        manager2 = make_manager(config_dir=isolated_config_dir)
+
+        assert manager1._load_schema() is manager2._load_schema()
+        assert manager1._get_validator() is manager2._get_validator()
+
+    def test_default_values(self, make_manager, isolated_config_dir):
         """Test default values when config sections are missing"""
         minimal_config = {
             "version": "1.0.0",
@@ -364,23 +498,22 @@ class TestEnterpriseConfigManager:
             }
         }
 
-        config_file = temp_config_dir / "environments" / "test.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(minimal_config, f)
+        config_file = isolated_config_dir / "environments" / "test.yml"
+        _write_files((config_file, yaml.dump(minimal_config, Dumper=YamlDumper).encode()))
 
-        manager = EnterpriseConfigManager(
-            config_dir=str(temp_config_dir),
-            environment="test"
-        )
+        manager = make_manager(config_dir=isolated_config_dir)
+
+        # All sections are built by one load
+        configs = manager.get_all_configs()
 
         # Test backup config with defaults
-        backup_config = manager.get_backup_config()
+        backup_config = configs.backup
         assert backup_config.max_memory_gb == 4.0  # Default value
         assert backup_config.max_cpu_percent == 75  # Default value
         assert backup_config.concurrent_uploads == 5  # Default value
 
         # Test monitoring config with defaults
-        monitoring_config = manager.get_monitoring_config()
+        monitoring_config = configs.monitoring
         assert monitoring_config.enabled is True  # Default value
         assert monitoring_config.health_port == 8080  # Default value
         assert monitoring_config.log_level == "INFO"  # Default value